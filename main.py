@@ -21,7 +21,7 @@ import threading
 import platform
 import math
 import os
-import time
+import queue
 
 # Optional numpy for generated sounds
 try:
@@ -30,6 +30,13 @@ try:
 except Exception:
     NUMPY_AVAILABLE = False
 
+# Optional numba for jitting the ball physics step
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
 # Try winsound on Windows as a fallback changes
 try:
     if platform.system() == "Windows":
@@ -40,6 +47,22 @@ try:
 except Exception:
     WINSOUND_AVAILABLE = False
 
+# Pre-size the mixer buffer before pygame.init: the SDL default (often 4096
+# samples, ~93 ms) is the entire paddle-hit latency budget; 512 samples is
+# ~11 ms and still safe for these short effects. PONG_AUDIO_BUFFER lets
+# users on finicky audio stacks (e.g. pipewire underruns) bump it back up
+# to 2048/4096.
+try:
+    AUDIO_BUFFER = int(os.environ.get('PONG_AUDIO_BUFFER', 512))
+except ValueError:
+    AUDIO_BUFFER = 512
+try:
+    # mono: the sfx duplicate the same waveform on both channels anyway,
+    # so a single channel halves every audio buffer
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=1, buffer=AUDIO_BUFFER)
+except Exception:
+    pass
+
 pygame.init()
 pygame.display.set_caption("Pong - Vibrant (With Realistic Sounds)")
 
@@ -52,11 +75,19 @@ PADDLE_SPEED = 7
 BALL_SPEED = 5
 SCORE_FONT_SIZE = 56
 WIN_SCORE = 7  # Score to trigger final explosion & win
+HALF_WIDTH = WIDTH // 2
+
+# Fixed physics timestep, decoupled from the render/display rate. Legacy
+# tuning constants below are expressed per 60 FPS frame, so steps scale
+# their effect by dt * 60.
+PHYSICS_HZ = 120
+FIXED_DT = 1.0 / PHYSICS_HZ
 
 # Physics tuning (new)
 BALL_MASS = 0.6
 PADDLE_MASS = 4.0
 BALL_MAX_SPEED = 14.0        # hard cap on ball speed
+BALL_MAX_SPEED_SQ = BALL_MAX_SPEED * BALL_MAX_SPEED
 BALL_DRAG = 0.997            # slight drag each frame
 SPIN_FACTOR = 0.28          # how much paddle motion imparts spin
 SPIN_DECAY = 0.96           # spin decay per frame
@@ -68,19 +99,87 @@ HIT_WAV = os.path.join(ASSETS_SOUNDS_DIR, "tennis_hit.wav")
 EXPLOSION_WAV = os.path.join(ASSETS_SOUNDS_DIR, "explosion.wav")
 SCORE_WAV = os.path.join(ASSETS_SOUNDS_DIR, "score.wav")  # optional lighter score sound
 
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+# SDL reads these env hints when the window is created: batching coalesces
+# the per-frame draw commands into single GPU submissions, and on Windows the
+# OpenGL driver avoids SDL's un-batched D3D11 path. setdefault so users can
+# still override from the environment.
+os.environ.setdefault('SDL_HINT_RENDER_BATCHING', '1')
+if platform.system() == "Windows":
+    os.environ.setdefault('SDL_RENDER_DRIVER', 'opengl')
+
+# Optional SDL2 renderer: keep one persistent streaming texture and upload
+# only the dirty regions of an off-screen surface to it each frame, instead
+# of letting the software display path re-upload the whole framebuffer.
+_window = None
+_renderer = None
+_texture = None
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+    _window = Window("Pong - Vibrant (With Realistic Sounds)", size=(WIDTH, HEIGHT))
+    _renderer = Renderer(_window, accelerated=1, vsync=1)
+    _texture = Texture(_renderer, (WIDTH, HEIGHT), streaming=True)
+    screen = pygame.Surface((WIDTH, HEIGHT))
+except Exception:
+    _window = _renderer = _texture = None
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+def present(dirty_rects):
+    """Push the given regions of the drawing surface to the window."""
+    if _renderer is not None:
+        bounds = screen.get_rect()
+        for r in dirty_rects:
+            r = r.clip(bounds)
+            if r.width > 0 and r.height > 0:
+                _texture.update(screen.subsurface(r), r)
+        _texture.draw()
+        _renderer.present()
+    else:
+        pygame.display.update(dirty_rects)
 clock = pygame.time.Clock()
 font = pygame.font.SysFont(None, SCORE_FONT_SIZE)
 
+# Frame pacing: clock.tick sleeps through the OS timer, whose default ~15 ms
+# granularity on Windows shows up as ball stutter. Ask for 1 ms resolution
+# for the process lifetime, and let users opt into a busy-wait tick
+# (PONG_BUSY_LOOP=1) for the tightest pacing at the cost of a core.
+if platform.system() == "Windows":
+    try:
+        import ctypes
+        import atexit
+        ctypes.windll.winmm.timeBeginPeriod(1)
+        atexit.register(ctypes.windll.winmm.timeEndPeriod, 1)
+    except Exception:
+        pass
+
+_tick = clock.tick_busy_loop if os.environ.get('PONG_BUSY_LOOP') else clock.tick
+
+# Only QUIT and KEYDOWN are ever handled, so filter everything else (notably
+# bulk mouse-motion events) out of the queue at the C level; paddle input
+# reads key state via pygame.key.get_pressed and is unaffected.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
 # Sound setup (uses pygame.mixer if available)
 SOUND_ON = True
 pygame_mixer_available = False
 try:
-    pygame.mixer.init(frequency=44100, size=-16, channels=2)
+    pygame.mixer.init()  # settings come from pygame.mixer.pre_init above
+    # enough channels that rapid hit/score/explosion overlaps don't steal
+    # each other mid-playback
+    pygame.mixer.set_num_channels(8)
     pygame_mixer_available = True
 except Exception:
     pygame_mixer_available = False
 
+# Dedicated channel for paddle hits: Channel.play skips the free-channel scan
+# that Sound.play does on every call.
+hit_channel = None
+if pygame_mixer_available:
+    try:
+        hit_channel = pygame.mixer.Channel(0)
+    except Exception:
+        hit_channel = None
+
 hit_sound = None
 score_sound = None
 explosion_sound = None
@@ -90,20 +189,52 @@ def make_sine_sound(freq=440, duration_ms=120, volume=0.3, sample_rate=44100):
     if not NUMPY_AVAILABLE or not pygame_mixer_available:
         return None
     samples = int(sample_rate * (duration_ms / 1000.0))
-    t = np.linspace(0, duration_ms/1000.0, samples, False)
-    # Add a slight attack/decay envelope for more natural tone
-    env = np.minimum(1.0, 10 * t) * np.exp(-3 * t)
-    wave = 0.5 * env * np.sin(2 * math.pi * freq * t)
-    audio = np.zeros((samples, 2), dtype=np.int16)
     max_amp = np.iinfo(np.int16).max
-    audio[:, 0] = (wave * max_amp * volume).astype(np.int16)
-    audio[:, 1] = (wave * max_amp * volume).astype(np.int16)
+    # Single float32 pass: half the bandwidth of the old float64 linspace
+    # pipeline, in-place ufuncs avoid full-size temporaries, and the mixer
+    # runs mono so the buffer is a plain 1-D int16 array.
+    t = np.arange(samples, dtype=np.float32) * np.float32(1.0 / sample_rate)
+    # Slight attack/decay envelope for a more natural tone, built with
+    # out= ufuncs so only the two working arrays are ever allocated
+    env = t * np.float32(10.0)
+    np.minimum(env, np.float32(1.0), out=env)
+    decay = t * np.float32(-3.0)
+    np.exp(decay, out=decay)
+    env *= decay
+    wave = np.sin(np.multiply(t, np.float32(2 * math.pi * freq), out=t), out=t)
+    wave *= env
+    wave *= np.float32(0.5 * max_amp * volume)
+    audio = wave.astype(np.int16)
     try:
         sound = pygame.sndarray.make_sound(audio)
         return sound
     except Exception:
         return None
 
+def make_explosion_rumble(sample_rate=44100):
+    """Pre-mix the layered explosion rumble (low/mid/snap sines with their
+    stagger offsets) into one Sound. Returns None if numpy or mixer unavailable."""
+    if not NUMPY_AVAILABLE or not pygame_mixer_available:
+        return None
+    max_amp = np.iinfo(np.int16).max
+    # (freq, duration_s, volume, start offset_s) — same stagger the old
+    # thread produced with sleeps between three separate Sounds
+    layers = ((120, 0.9, 0.6, 0.0), (220, 0.7, 0.45, 0.06), (1000, 0.12, 0.35, 0.18))
+    total = int(sample_rate * 0.9)
+    mix = np.zeros(total, np.float32)
+    for freq, duration, volume, offset in layers:
+        start = int(sample_rate * offset)
+        n = min(int(sample_rate * duration), total - start)
+        t = np.arange(n, dtype=np.float32) * np.float32(1.0 / sample_rate)
+        env = np.minimum(1.0, 10 * t) * np.exp(-3 * t)
+        mix[start:start + n] += np.float32(0.5 * volume) * env * np.sin(t * np.float32(2 * math.pi * freq))
+    np.clip(mix, -1.0, 1.0, out=mix)
+    mix *= np.float32(max_amp)
+    try:
+        return pygame.sndarray.make_sound(mix.astype(np.int16))
+    except Exception:
+        return None
+
 def try_load_sound(path):
     """Tries loading a WAV files via pygame mixer; return a Sound or None."""
     if not pygame_mixer_available:
@@ -115,21 +246,32 @@ def try_load_sound(path):
         pass
     return None
 
-# Attempt to load realistic WAVs first
-if pygame_mixer_available:
-    hit_sound = try_load_sound(HIT_WAV)
-    explosion_sound = try_load_sound(EXPLOSION_WAV)
-    score_sound = try_load_sound(SCORE_WAV)
-
-# If no WAVs, prepare fallback tones
-if hit_sound is None and pygame_mixer_available and NUMPY_AVAILABLE:
-    # short, sharp tone for hit (higher frequency, short)
-    hit_sound = make_sine_sound(freq=800, duration_ms=60, volume=0.25)
-if score_sound is None and pygame_mixer_available and NUMPY_AVAILABLE:
-    score_sound = make_sine_sound(freq=360, duration_ms=220, volume=0.32)
-if explosion_sound is None and pygame_mixer_available and NUMPY_AVAILABLE:
-    # explosion fallback: layered low rumble (created when playing)
-    explosion_sound = None  # we'll synthesize a short rumble via threads if needed
+# Sound preparation (WAV loading plus fallback synthesis) runs on a
+# background warmup thread so startup and the first rally never stall on
+# it; the play_* functions simply fall back to beeps or silence until the
+# module-level Sound objects are populated.
+_sounds_ready = threading.Event()
+
+def _build_sounds():
+    global hit_sound, score_sound, explosion_sound
+    if pygame_mixer_available:
+        # Attempt to load realistic WAVs first
+        hit_sound = try_load_sound(HIT_WAV)
+        explosion_sound = try_load_sound(EXPLOSION_WAV)
+        score_sound = try_load_sound(SCORE_WAV)
+        # If no WAVs, prepare fallback tones
+        if hit_sound is None and NUMPY_AVAILABLE:
+            # short, sharp tone for hit (higher frequency, short)
+            hit_sound = make_sine_sound(freq=800, duration_ms=60, volume=0.25)
+        if score_sound is None and NUMPY_AVAILABLE:
+            score_sound = make_sine_sound(freq=360, duration_ms=220, volume=0.32)
+        if explosion_sound is None and NUMPY_AVAILABLE:
+            # explosion fallback: layered low rumble, pre-mixed so the
+            # trigger is just a Sound.play
+            explosion_sound = make_explosion_rumble()
+    _sounds_ready.set()
+
+threading.Thread(target=_build_sounds, daemon=True).start()
 
 def _winsound_beep(freq, duration_ms):
     try:
@@ -137,6 +279,21 @@ def _winsound_beep(freq, duration_ms):
     except Exception:
         pass
 
+# One long-lived worker drains queued (freq, duration_ms) beeps so the play_*
+# functions never pay thread-spawn cost on the hot path.
+_beep_queue = None
+if WINSOUND_AVAILABLE:
+    _beep_queue = queue.SimpleQueue()
+    def _beep_worker():
+        while True:
+            freq, duration_ms = _beep_queue.get()
+            _winsound_beep(freq, duration_ms)
+    threading.Thread(target=_beep_worker, daemon=True).start()
+
+def queue_beep(freq, duration_ms):
+    if _beep_queue is not None:
+        _beep_queue.put_nowait((freq, duration_ms))
+
 def play_sound_obj(sound):
     try:
         if sound and SOUND_ON:
@@ -148,10 +305,16 @@ def play_hit_sound():
     if not SOUND_ON:
         return
     if pygame_mixer_available and hit_sound:
-        play_sound_obj(hit_sound)
+        try:
+            if hit_channel is not None:
+                hit_channel.play(hit_sound)
+            else:
+                play_sound_obj(hit_sound)
+        except Exception:
+            pass
         return
     if WINSOUND_AVAILABLE:
-        threading.Thread(target=_winsound_beep, args=(1200, 60), daemon=True).start()
+        queue_beep(1200, 60)
 
 def play_score_sound():
     if not SOUND_ON:
@@ -160,32 +323,19 @@ def play_score_sound():
         play_sound_obj(score_sound)
         return
     if WINSOUND_AVAILABLE:
-        threading.Thread(target=_winsound_beep, args=(480, 200), daemon=True).start()
+        queue_beep(480, 200)
 
 def play_explosion_sound():
     if not SOUND_ON:
         return
     if pygame_mixer_available and explosion_sound:
-        # if a real WAV is provided
+        # real WAV if provided, otherwise the pre-mixed rumble
         play_sound_obj(explosion_sound)
         return
-    if pygame_mixer_available and NUMPY_AVAILABLE:
-        # generate a multi-layered rumble (non-blocking)
-        def rumble():
-            base = make_sine_sound(freq=120, duration_ms=900, volume=0.6)
-            mid = make_sine_sound(freq=220, duration_ms=700, volume=0.45)
-            snap = make_sine_sound(freq=1000, duration_ms=120, volume=0.35)
-            if base: base.play()
-            time.sleep(0.06)
-            if mid: mid.play()
-            time.sleep(0.12)
-            if snap: snap.play()
-        threading.Thread(target=rumble, daemon=True).start()
-        return
     if WINSOUND_AVAILABLE:
         # fallback beeps for Windows
-        threading.Thread(target=_winsound_beep, args=(300, 600), daemon=True).start()
-        threading.Thread(target=_winsound_beep, args=(150, 900), daemon=True).start()
+        queue_beep(300, 600)
+        queue_beep(150, 900)
 
 # Enhanced color palettes with gradients
 PALETTES = [
@@ -217,99 +367,311 @@ PALETTES = [
 palette_index = 0
 palette = PALETTES[palette_index]
 
-# Particles for ball trail and explosion
-particles = []
-explosion_particles = []
+# Dedicated RNG with pre-bound methods for the hot paths: skips the
+# module-singleton attribute lookup that random.uniform etc. pay per call.
+_rng = random.Random(os.urandom(16))
+_uniform = _rng.uniform
+_random = _rng.random
+
+# numpy Generator for burst spawns: one vectorized draw per attribute
+# instead of a Python RNG call per particle
+_np_rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+
+# Particles for ball trail and explosion. With numpy the state lives in
+# structure-of-arrays buffers so a whole pool updates in a handful of
+# vectorized ops; without numpy a list of dicts is kept as before.
+MAX_TRAIL_PARTICLES = 1024
+MAX_EXPLOSION_PARTICLES = 256
+
+# Particles come in a handful of palette colors and integer radii, so each
+# distinct circle is rasterized exactly once and then only blitted.
+_particle_sprite_cache = {}  # (color, radius) -> Surface
+
+def get_particle_sprite(color, radius):
+    key = (color, radius)
+    spr = _particle_sprite_cache.get(key)
+    if spr is None:
+        spr = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(spr, color, (radius, radius), radius)
+        _particle_sprite_cache[key] = spr
+    return spr
+
+class ParticlePool:
+    """Fixed-capacity particle pool with per-pool damping and gravity.
+
+    Updates are vectorized over parallel float32 arrays when numpy is
+    available; expired particles are compacted out with a boolean mask."""
+
+    def __init__(self, capacity, damping=1.0, gravity=0.08):
+        self.capacity = capacity
+        self.damping = damping
+        self.gravity = gravity
+        if NUMPY_AVAILABLE:
+            self.n = 0
+            self.pos_x = np.zeros(capacity, np.float32)
+            self.pos_y = np.zeros(capacity, np.float32)
+            self.vel_x = np.zeros(capacity, np.float32)
+            self.vel_y = np.zeros(capacity, np.float32)
+            self.age = np.zeros(capacity, np.float32)
+            self.life = np.zeros(capacity, np.float32)
+            self.size = np.zeros(capacity, np.float32)
+            self.color = np.zeros((capacity, 3), np.uint8)
+        else:
+            self.items = []
+
+    def __len__(self):
+        return self.n if NUMPY_AVAILABLE else len(self.items)
+
+    def clear(self):
+        if NUMPY_AVAILABLE:
+            self.n = 0
+        else:
+            self.items.clear()
+
+    def emit(self, x, y, vx, vy, life, size, color):
+        if NUMPY_AVAILABLE:
+            if self.n >= self.capacity:
+                return
+            i = self.n
+            self.pos_x[i] = x
+            self.pos_y[i] = y
+            self.vel_x[i] = vx
+            self.vel_y[i] = vy
+            self.age[i] = 0.0
+            self.life[i] = life
+            self.size[i] = size
+            self.color[i] = color
+            self.n = i + 1
+        else:
+            self.items.append({'pos': [x, y], 'vel': [vx, vy], 'life': life,
+                               'age': 0, 'color': color, 'size': size})
+
+    def emit_many(self, xs, ys, vxs, vys, lives, sizes, color):
+        """Bulk-append arrays of particles sharing one color (numpy path)."""
+        count = min(len(xs), self.capacity - self.n)
+        if count <= 0:
+            return
+        i = self.n
+        j = i + count
+        self.pos_x[i:j] = xs[:count]
+        self.pos_y[i:j] = ys[:count]
+        self.vel_x[i:j] = vxs[:count]
+        self.vel_y[i:j] = vys[:count]
+        self.age[i:j] = 0.0
+        self.life[i:j] = lives[:count]
+        self.size[i:j] = sizes[:count]
+        self.color[i:j] = color
+        self.n = j
+
+    def update(self, dt):
+        step = 60 * dt
+        if NUMPY_AVAILABLE:
+            n = self.n
+            if n == 0:
+                return
+            self.age[:n] += dt
+            self.pos_x[:n] += self.vel_x[:n] * step
+            self.pos_y[:n] += self.vel_y[:n] * step
+            if self.damping != 1.0:
+                damp = self.damping ** step  # damping is per 60 FPS frame
+                self.vel_x[:n] *= damp
+                self.vel_y[:n] *= damp
+            self.vel_y[:n] += self.gravity * step
+            alive = self.age[:n] < self.life[:n]
+            m = int(alive.sum())
+            if m != n:
+                for arr in (self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+                            self.age, self.life, self.size):
+                    arr[:m] = arr[:n][alive]
+                self.color[:m] = self.color[:n][alive]
+                self.n = m
+        else:
+            survivors = []
+            for p in self.items:
+                p['age'] += dt
+                p['pos'][0] += p['vel'][0] * step
+                p['pos'][1] += p['vel'][1] * step
+                if self.damping != 1.0:
+                    damp = self.damping ** step  # damping is per 60 FPS frame
+                    p['vel'][0] *= damp
+                    p['vel'][1] *= damp
+                p['vel'][1] += self.gravity * step
+                if p['age'] < p['life']:
+                    survivors.append(p)
+            if len(survivors) != len(self.items):
+                self.items = survivors
+
+    def draw(self, surf):
+        # gather (sprite, dest) pairs and submit them in one blits call;
+        # the circles themselves are rasterized once per (color, radius)
+        blit_list = []
+        if NUMPY_AVAILABLE:
+            for i in range(self.n):
+                r = max(1, int(self.size[i]))
+                col = (int(self.color[i][0]), int(self.color[i][1]), int(self.color[i][2]))
+                blit_list.append((get_particle_sprite(col, r),
+                                  (int(self.pos_x[i]) - r, int(self.pos_y[i]) - r)))
+        else:
+            for p in self.items:
+                r = max(1, int(p['size']))
+                blit_list.append((get_particle_sprite(tuple(p['color']), r),
+                                  (int(p['pos'][0]) - r, int(p['pos'][1]) - r)))
+        if not blit_list:
+            return []
+        return surf.blits(blit_list)
+
+# trail has no damping; explosion bits get air resistance and more gravity
+particles = ParticlePool(MAX_TRAIL_PARTICLES, damping=1.0, gravity=0.08)
+explosion_particles = ParticlePool(MAX_EXPLOSION_PARTICLES, damping=0.985, gravity=0.45)
 
 def add_particle(x, y, color, size=None, vel=None, life=None):
-    p = {
-        'pos': [x, y],
-        'vel': vel if vel is not None else [random.uniform(-0.6, 0.6), random.uniform(-0.6, 0.6)],
-        'life': life if life is not None else random.uniform(0.35, 0.9),
-        'age': 0,
-        'color': color,
-        'size': size if size is not None else random.uniform(2, 5)
-    }
-    particles.append(p)
+    if vel is None:
+        vel = [_uniform(-0.6, 0.6), _uniform(-0.6, 0.6)]
+    particles.emit(x, y, vel[0], vel[1],
+                   life if life is not None else _uniform(0.35, 0.9),
+                   size if size is not None else _uniform(2, 5),
+                   color)
 
 def add_explosion(cx, cy, color, count=60):
     explosion_particles.clear()
+    if NUMPY_AVAILABLE:
+        # one vectorized draw per attribute instead of ~6 RNG calls per particle
+        angles = _np_rng.uniform(0.0, 2.0 * math.pi, count)
+        speeds = _np_rng.uniform(2.5, 8.5, count)
+        explosion_particles.emit_many(np.full(count, cx, np.float32),
+                                      np.full(count, cy, np.float32),
+                                      np.cos(angles) * speeds,
+                                      np.sin(angles) * speeds,
+                                      _np_rng.uniform(0.9, 1.6, count),
+                                      _np_rng.uniform(3.5, 9.0, count),
+                                      color)
+        return
     for _ in range(count):
-        angle = random.uniform(0, math.pi*2)
-        speed = random.uniform(2.5, 8.5)
-        vx = math.cos(angle) * speed
-        vy = math.sin(angle) * speed
-        explosion_particles.append({'pos': [cx, cy], 'vel':[vx, vy], 'life': random.uniform(0.9, 1.6), 'age':0, 'color': color, 'size': random.uniform(3.5, 9.0)})
+        angle = _uniform(0, math.pi*2)
+        speed = _uniform(2.5, 8.5)
+        explosion_particles.emit(cx, cy, math.cos(angle) * speed, math.sin(angle) * speed,
+                                 _uniform(0.9, 1.6), _uniform(3.5, 9.0), color)
 
 def update_particles(dt):
-    # update small trail particles
-    for p in particles[:]:
-        p['age'] += dt
-        p['pos'][0] += p['vel'][0] * 60 * dt
-        p['pos'][1] += p['vel'][1] * 60 * dt
-        # apply slight gravity-ish or downward bias for style (small)
-        p['vel'][1] += 0.08 * dt * 60
-        if p['age'] >= p['life']:
-            particles.remove(p)
-    # update explosion particles with damping
-    for p in explosion_particles[:]:
-        p['age'] += dt
-        p['pos'][0] += p['vel'][0] * 60 * dt
-        p['pos'][1] += p['vel'][1] * 60 * dt
-        # dampen velocities to simulate air resistance
-        p['vel'][0] *= 0.985
-        p['vel'][1] *= 0.985
-        # gravity pull for explosion bits
-        p['vel'][1] += 0.45 * dt * 60
-        if p['age'] >= p['life']:
-            explosion_particles.remove(p)
-
-# Utility: vertical gradient
+    particles.update(dt)
+    explosion_particles.update(dt)
+
+# Utility: vertical gradient. Interpolate a 1 x height column (one numpy
+# expression when available) and let smoothscale stretch it across the full
+# width, instead of issuing a draw.line call per row.
 def draw_vertical_gradient(surf, top_col, bottom_col):
-    height = surf.get_height()
-    for y in range(height):
-        ratio = y / height
-        r = int(top_col[0] * (1 - ratio) + bottom_col[0] * ratio)
-        g = int(top_col[1] * (1 - ratio) + bottom_col[1] * ratio)
-        b = int(top_col[2] * (1 - ratio) + bottom_col[2] * ratio)
-        pygame.draw.line(surf, (r, g, b), (0, y), (surf.get_width(), y))
+    width, height = surf.get_size()
+    column = pygame.Surface((1, height))
+    if NUMPY_AVAILABLE:
+        # pure integer interpolation: no float plane, no per-channel casts,
+        # result is directly a uint8 pixel array
+        top = np.asarray(top_col, dtype=np.int32)
+        bottom = np.asarray(bottom_col, dtype=np.int32)
+        ratio = np.arange(height, dtype=np.int32)[:, None]
+        rgb = (top + (bottom - top) * ratio // height).astype(np.uint8)
+        pygame.surfarray.blit_array(column, rgb[None, :, :])
+    else:
+        for y in range(height):
+            r = top_col[0] + (bottom_col[0] - top_col[0]) * y // height
+            g = top_col[1] + (bottom_col[1] - top_col[1]) * y // height
+            b = top_col[2] + (bottom_col[2] - top_col[2]) * y // height
+            column.set_at((0, y), (r, g, b))
+    surf.blit(pygame.transform.smoothscale(column, (width, height)), (0, 0))
 
 # Creative shapes drawing helpers
+_highlight_cache = {}  # body color -> brightened inner-highlight tuple
+
+def get_highlight(color):
+    highlight = _highlight_cache.get(color)
+    if highlight is None:
+        try:
+            highlight = tuple(min(255, c + 30) for c in color)
+        except Exception:
+            highlight = color
+        _highlight_cache[color] = highlight
+    return highlight
+
 def draw_paddle_shape(surf, rect, color, fin_color):
     # rounded rect body
     pygame.draw.rect(surf, color, rect, border_radius=int(rect.width/2))
     # triangular fin pointing outward depending on side
-    if rect.centerx < WIDTH//2:
+    if rect.centerx < HALF_WIDTH:
         tri = [(rect.left, rect.centery), (rect.left + int(rect.width*0.6), rect.top), (rect.left + int(rect.width*0.6), rect.bottom)]
     else:
         tri = [(rect.right, rect.centery), (rect.right - int(rect.width*0.6), rect.top), (rect.right - int(rect.width*0.6), rect.bottom)]
     pygame.draw.polygon(surf, fin_color, tri)
     # subtle inner highlight
     inner = rect.inflate(-6, -20)
-    try:
-        highlight = tuple(min(255, c+30) for c in color)
-    except Exception:
-        highlight = color
-    pygame.draw.rect(surf, highlight, inner, border_radius=int(inner.width/2))
+    pygame.draw.rect(surf, get_highlight(color), inner, border_radius=int(inner.width/2))
 
 # Creative shapes helpers continued (Paddle, Ball, draw, etc.)
 
+# Paddle and ball shapes are static between palette switches, so they are
+# rasterized once into small per-palette sprite Surfaces and submitted to the
+# screen in a single Surface.blits call instead of per-primitive draw calls.
+_sprite_cache = {}  # (palette_index, kind) -> Surface
+
+def get_paddle_sprite(side):
+    key = (palette_index, 'paddle_' + side)
+    spr = _sprite_cache.get(key)
+    if spr is None:
+        spr = pygame.Surface((PADDLE_WIDTH, PADDLE_HEIGHT), pygame.SRCALPHA)
+        draw_paddle_shape(spr, spr.get_rect(), palette['fg'], palette['accent'])
+        if side == 'right':
+            spr = pygame.transform.flip(spr, True, False)
+        _sprite_cache[key] = spr
+    return spr
+
+_glow_cache = {}  # palette_index -> pre-rendered ball glow Surface
+
+def get_ball_glow():
+    glow = _glow_cache.get(palette_index)
+    if glow is None:
+        glow = pygame.Surface((BALL_SIZE * 6, BALL_SIZE * 6), pygame.SRCALPHA)
+        g_radius = int(BALL_SIZE * 2.5)
+        center = glow.get_width() // 2
+        for i in range(g_radius, 0, -4):
+            alpha = int(25 * (1 - i / g_radius))
+            pygame.draw.circle(glow, (*palette['ball'], alpha), (center, center), i)
+        _glow_cache[palette_index] = glow
+    return glow
+
+def get_ball_sprite():
+    key = (palette_index, 'ball')
+    spr = _sprite_cache.get(key)
+    if spr is None:
+        size = BALL_SIZE * 2
+        spr = pygame.Surface((size, size), pygame.SRCALPHA)
+        c = size // 2
+        pts = [(x + c, y + c) for x, y in BALL_STAR_BASE]
+        pygame.draw.polygon(spr, palette['ball'], pts)
+        pygame.draw.circle(spr, palette['fg'], (c, c), int(BALL_SIZE * 0.25))
+        _sprite_cache[key] = spr
+    return spr
+
 # Paddle class with inertia and recoil
 class Paddle:
+    _Y_MAX = HEIGHT - PADDLE_HEIGHT
+
     def __init__(self, x, y):
         self.rect = pygame.Rect(x, y, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.y = float(y)  # authoritative position; rect is synced for draw/collision
         self.speed = PADDLE_SPEED
         self.vel = 0.0
         self._target_vel = 0.0
         self.inertia = 0.6
 
-    def move(self, dy):
+    def move(self, dy, dt=1.0 / FPS):
+        # inertia and speed are tuned per 60 FPS frame, so a fixed physics
+        # step scales their effect by dt * 60
+        scale = dt * 60.0
+        blend = self.inertia ** scale
         self._target_vel = dy
-        self.vel = self.vel * self.inertia + self._target_vel * (1.0 - self.inertia)
-        if self.vel < 0:
-            self.rect.y = max(self.rect.y + int(self.vel), 0)
-        else:
-            self.rect.y = min(self.rect.y + int(self.vel), HEIGHT - PADDLE_HEIGHT)
+        self.vel = self.vel * blend + self._target_vel * (1.0 - blend)
+        # single clamp instead of a direction branch; float y keeps the
+        # subpixel motion that int rect arithmetic used to truncate away
+        self.y = min(max(self.y + self.vel * scale, 0.0), self._Y_MAX)
+        self.rect.y = int(self.y)
 
     def apply_recoil(self, impulse):
         self.vel += impulse
@@ -323,127 +685,368 @@ class Paddle:
         else:
             self.move(0)
 
-    def draw(self, surf):
-        body_color = palette['fg']
-        fin_color = palette['accent']
-        draw_paddle_shape(surf, self.rect, body_color, fin_color)
+    def blit_entry(self):
+        side = 'left' if self.rect.centerx < HALF_WIDTH else 'right'
+        return (get_paddle_sprite(side), self.rect)
+
+# Pure-math portions of the ball step, kept free of pygame/random so numba
+# can compile them to native code when it is installed; the plain Python
+# versions are used otherwise.
+def _free_flight(x, y, vx, vy, spin, scale):
+    """Spin decay, integration and wall bounces for one step.
+
+    Returns (x, y, vx, vy, spin, wall_hit)."""
+    if abs(spin) > 0.001:
+        vy += spin * 0.12 * scale
+        spin *= SPIN_DECAY ** scale
+    x += vx * scale
+    y += vy * scale
+    wall_hit = False
+    if y <= 0.0:
+        y = 0.0
+        vy = -vy
+        vx *= 1.01
+        spin *= 0.6
+        wall_hit = True
+    if y + BALL_SIZE >= HEIGHT:
+        y = HEIGHT - BALL_SIZE
+        vy = -vy
+        vx *= 1.01
+        spin *= 0.6
+        wall_hit = True
+    return x, y, vx, vy, spin, wall_hit
+
+def _drag_and_cap(vx, vy, scale):
+    """Per-step drag plus the BALL_MAX_SPEED cap. Returns (vx, vy)."""
+    drag = BALL_DRAG ** scale
+    vx *= drag
+    vy *= drag
+    # compare squared magnitudes; only pay for the sqrt when actually capping
+    spd_sq = vx * vx + vy * vy
+    if spd_sq > BALL_MAX_SPEED_SQ:
+        cap = BALL_MAX_SPEED / math.sqrt(spd_sq)
+        vx *= cap
+        vy *= cap
+    return vx, vy
+
+if NUMBA_AVAILABLE:
+    _free_flight = njit(cache=True, fastmath=True)(_free_flight)
+    _drag_and_cap = njit(cache=True, fastmath=True)(_drag_and_cap)
 
 # Ball class with spin, drag, momentum transfer
 class Ball:
     def __init__(self):
-        self.rect = pygame.Rect(WIDTH // 2 - BALL_SIZE // 2, WIDTH // 2 - BALL_SIZE // 2, BALL_SIZE, BALL_SIZE)
+        self.rect = pygame.Rect(0, 0, BALL_SIZE, BALL_SIZE)
         self.reset()
         self.spin = 0.0
 
     def reset(self, direction=None):
-        self.rect.center = (WIDTH // 2, HEIGHT // 2)
-        vx = BALL_SPEED if direction is None else BALL_SPEED * direction
-        vy = random.choice([-1, 1]) * random.uniform(2, 4)
-        self.vel = [vx, vy]
+        # floats are authoritative; the Rect is only synced for collision
+        # tests and drawing, so subpixel motion survives across frames
+        self.x = WIDTH / 2 - BALL_SIZE / 2
+        self.y = HEIGHT / 2 - BALL_SIZE / 2
+        self.vx = BALL_SPEED if direction is None else BALL_SPEED * direction
+        self.vy = (1 if _random() < 0.5 else -1) * _uniform(2, 4)
         self.spin = 0.0
-        if direction is None and random.random() < 0.5:
-            self.vel[0] *= -1
+        if direction is None and _random() < 0.5:
+            self.vx = -self.vx
+        self._sync_rect()
 
-    def update(self, left_paddle, right_paddle):
-        # Apply spin (Magnus-like effect): spin slightly alters vertical velocity
-        if abs(self.spin) > 0.001:
-            self.vel[1] += self.spin * 0.12
-            self.spin *= SPIN_DECAY
+    def _sync_rect(self):
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
 
-        # move ball
-        self.rect.x += int(self.vel[0])
-        self.rect.y += int(self.vel[1])
+    def update(self, left_paddle, right_paddle, dt=FIXED_DT):
+        scale = dt * 60.0
+        # spin (Magnus-like effect), integration and wall bounces run in the
+        # jittable free-flight kernel
+        self.x, self.y, self.vx, self.vy, self.spin, wall_hit = _free_flight(
+            self.x, self.y, self.vx, self.vy, self.spin, scale)
+        if wall_hit:
+            play_hit_sound()
 
         # Add particle trail with velocity-based spread
-        for _ in range(1):
-            px = self.rect.centerx + random.uniform(-2, 2)
-            py = self.rect.centery + random.uniform(-2, 2)
-            pvel = [ -self.vel[0]*0.04 + random.uniform(-0.8,0.8), -self.vel[1]*0.04 + random.uniform(-0.8,0.8)]
-            particles.append({'pos':[px,py],'vel':pvel,'life':random.uniform(0.3,0.9),'age':0,'color':palette['ball'],'size':random.uniform(2,4)})
-
-        # Top/bottom collision
-        if self.rect.top <= 0:
-            self.rect.top = 0
-            self.vel[1] *= -1
-            self.vel[0] *= 1.01
-            self.spin *= 0.6
-            play_hit_sound()
-        if self.rect.bottom >= HEIGHT:
-            self.rect.bottom = HEIGHT
-            self.vel[1] *= -1
-            self.vel[0] *= 1.01
-            self.spin *= 0.6
-            play_hit_sound()
+        particles.emit(self.x + BALL_SIZE / 2 + _uniform(-2, 2),
+                       self.y + BALL_SIZE / 2 + _uniform(-2, 2),
+                       -self.vx*0.04 + _uniform(-0.8, 0.8),
+                       -self.vy*0.04 + _uniform(-0.8, 0.8),
+                       _uniform(0.3, 0.9), _uniform(2, 4), palette['ball'])
 
-        # Paddle collisions with momentum and spin transfer
-        if self.rect.colliderect(left_paddle.rect) and self.vel[0] < 0:
-            offset = (self.rect.centery - left_paddle.rect.centery) / (PADDLE_HEIGHT / 2)
-            spin_from_paddle = left_paddle.vel * SPIN_FACTOR + offset * 1.0
-            self._bounce(left_paddle, spin_from_paddle)
-            left_paddle.apply_recoil(-PADDLE_RECOIL * math.copysign(1, self.vel[0]))
-            play_hit_sound()
+        self._sync_rect()
 
-        if self.rect.colliderect(right_paddle.rect) and self.vel[0] > 0:
-            offset = (self.rect.centery - right_paddle.rect.centery) / (PADDLE_HEIGHT / 2)
-            spin_from_paddle = right_paddle.vel * SPIN_FACTOR + offset * 1.0
-            self._bounce(right_paddle, spin_from_paddle)
-            right_paddle.apply_recoil(PADDLE_RECOIL * math.copysign(1, self.vel[0]))
-            play_hit_sound()
+        # Paddle collisions with momentum and spin transfer; both sides go
+        # through one shared branch path
+        self._paddle_hit(left_paddle, -1)
+        self._paddle_hit(right_paddle, 1)
+
+        # Apply drag to limit runaway speeds, and cap speed
+        self.vx, self.vy = _drag_and_cap(self.vx, self.vy, scale)
 
-        # Apply drag to limit runaway speeds and add small damping
-        self.vel[0] *= BALL_DRAG
-        self.vel[1] *= BALL_DRAG
+    def _paddle_hit(self, paddle, sign):
+        """Collision test and response against one paddle.
 
-        # Cap speed
-        spd = math.hypot(self.vel[0], self.vel[1])
-        if spd > BALL_MAX_SPEED:
-            scale = BALL_MAX_SPEED / spd
-            self.vel[0] *= scale
-            self.vel[1] *= scale
+        sign is -1 for the left paddle (ball must be travelling left) and
+        +1 for the right. Plain AABB comparisons with the direction test
+        first, so most frames bail out before touching the y coordinates."""
+        if self.vx * sign <= 0:
+            return False
+        prect = paddle.rect
+        if (self.rect.right < prect.left or self.rect.left > prect.right
+                or self.rect.bottom <= prect.top or self.rect.top >= prect.bottom):
+            return False
+        offset = (self.rect.centery - prect.centery) / (PADDLE_HEIGHT / 2)
+        spin_from_paddle = paddle.vel * SPIN_FACTOR + offset * 1.0
+        self._bounce(paddle, spin_from_paddle)
+        paddle.apply_recoil(sign * PADDLE_RECOIL * math.copysign(1, self.vx))
+        play_hit_sound()
+        return True
 
     def _bounce(self, paddle, spin_input=0.0):
         paddle_vy = paddle.vel
-        self.vel[0] = -self.vel[0] * BOUNCE_ELASTICITY
-        self.vel[1] += paddle_vy * (PADDLE_MASS / (PADDLE_MASS + BALL_MASS)) * 0.9
+        self.vx = -self.vx * BOUNCE_ELASTICITY
+        self.vy += paddle_vy * (PADDLE_MASS / (PADDLE_MASS + BALL_MASS)) * 0.9
         self.spin += spin_input * 0.9
-        if self.vel[0] == 0:
-            self.vel[0] = BALL_SPEED * (1 if random.random() < 0.5 else -1)
+        if self.vx == 0:
+            self.vx = BALL_SPEED * (1 if _random() < 0.5 else -1)
 
-    def draw(self, surf):
-        cx, cy = self.rect.center
-        glow_surf = pygame.Surface((self.rect.width*6, self.rect.height*6), pygame.SRCALPHA)
-        g_radius = int(max(self.rect.width, self.rect.height)*2.5)
-        for i in range(g_radius, 0, -4):
-            alpha = int(25 * (1 - i / g_radius))
-            col = (*palette['ball'], alpha)
-            pygame.draw.circle(glow_surf, col, (glow_surf.get_width()//2, glow_surf.get_height()//2), i)
-        surf.blit(glow_surf, (cx - glow_surf.get_width()//2, cy - glow_surf.get_height()//2), special_flags=pygame.BLEND_PREMULTIPLIED)
-        pts = regular_star_points(cx, cy, self.rect.width, self.rect.width*0.45, 5)
-        pygame.draw.polygon(surf, palette['ball'], pts)
-        pygame.draw.circle(surf, palette['fg'], (cx, cy), int(self.rect.width*0.25))
-
-# update_particles fixed (removed stray quote)
-def update_particles(dt):
-    # update small trail particles
-    for p in particles[:]:
-        p['age'] += dt
-        p['pos'][0] += p['vel'][0] * 60 * dt
-        p['pos'][1] += p['vel'][1] * 60 * dt
-        # apply slight gravity-ish or downward bias for style (small)
-        p['vel'][1] += 0.08 * dt * 60
-        if p['age'] >= p['life']:
-            particles.remove(p)
-    # update explosion particles with damping
-    for p in explosion_particles[:]:
-        p['age'] += dt
-        p['pos'][0] += p['vel'][0] * 60 * dt
-        p['pos'][1] += p['vel'][1] * 60 * dt
-        # dampen velocities to simulate air resistance
-        p['vel'][0] *= 0.985
-        p['vel'][1] *= 0.985
-        # gravity pull for explosion bits
-        p['vel'][1] += 0.45 * dt * 60
-        if p['age'] >= p['life']:
-            explosion_particles.remove(p)
-
-# Remaining game code (drawing, main loop) is unchanged and kept as in previous commit.
\ No newline at end of file
+    def blit_entries(self, alpha=0.0):
+        # extrapolate the draw position into the partial physics step left in
+        # the accumulator so rendering stays smooth between fixed steps
+        scale = FIXED_DT * 60.0 * alpha
+        cx = int(self.x + self.vx * scale) + BALL_SIZE // 2
+        cy = int(self.y + self.vy * scale) + BALL_SIZE // 2
+        glow_surf = get_ball_glow()
+        sprite = get_ball_sprite()
+        return [(glow_surf, (cx - glow_surf.get_width()//2, cy - glow_surf.get_height()//2), None, pygame.BLEND_PREMULTIPLIED),
+                (sprite, (cx - sprite.get_width()//2, cy - sprite.get_height()//2))]
+
+# Star shape helper for the ball
+def regular_star_points(cx, cy, outer_r, inner_r, points=5):
+    pts = []
+    step = math.pi / points
+    angle = -math.pi / 2
+    for i in range(points * 2):
+        r = outer_r if i % 2 == 0 else inner_r
+        pts.append((int(cx + math.cos(angle) * r), int(cy + math.sin(angle) * r)))
+        angle += step
+    return pts
+
+# The ball star never changes size, so its ten vertices are computed once
+# around the origin and merely translated where needed.
+BALL_STAR_BASE = regular_star_points(0, 0, BALL_SIZE, BALL_SIZE * 0.45, 5)
+
+# The dashed center line is an unchanging pattern: bake it once per palette
+# into a 2 x HEIGHT strip and blit that, instead of 30 draw.rect calls.
+_center_strip_cache = {}  # palette_index -> dash strip Surface
+
+def get_center_strip():
+    strip = _center_strip_cache.get(palette_index)
+    if strip is None:
+        strip = pygame.Surface((2, HEIGHT), pygame.SRCALPHA)
+        for y in range(0, HEIGHT, 20):
+            pygame.draw.rect(strip, palette['accent'], (0, y + 4, 2, 12))
+        _center_strip_cache[palette_index] = strip
+    return strip
+
+def draw_center_line(surf):
+    surf.blit(get_center_strip(), (HALF_WIDTH - 1, 0))
+
+def draw_particles(surf):
+    return particles.draw(surf) + explosion_particles.draw(surf)
+
+# The gradient + center line never change between palette switches, so they
+# are rendered once into a cached background Surface. Each frame erases the
+# previous positions of the moving pieces by blitting the matching background
+# regions back, and only those dirty regions are pushed to the display.
+_background_cache = {}  # palette_index -> background Surface
+
+def get_background():
+    bg = _background_cache.get(palette_index)
+    if bg is None:
+        bg = pygame.Surface((WIDTH, HEIGHT))
+        draw_vertical_gradient(bg, palette['bg_top'], palette['bg_bottom'])
+        draw_center_line(bg)
+        _background_cache[palette_index] = bg
+    return bg
+
+# Overlay fonts are built once at module load; rasterized text surfaces are
+# memoized so the steady-state frame only blits pre-rendered surfaces.
+instr_font = pygame.font.SysFont(None, 20)
+status_font = pygame.font.SysFont(None, 18)
+
+INSTRUCTION_TEXT = "W/S + Up/Down: move | Space: serve | C: palette | M: sound | Esc: quit"
+
+_digit_cache = {}    # palette_index -> list of 10 rendered digit Surfaces
+_instr_cache = {}    # palette_index -> instruction Surface
+_status_cache = {}   # (palette_index, SOUND_ON) -> status Surface
+_overlay_cache = {}  # (palette_index, text) -> big overlay Surface
+
+def clear_text_caches():
+    """Drop memoized text surfaces; call whenever the palette changes."""
+    _instr_cache.clear()
+    _status_cache.clear()
+    _overlay_cache.clear()
+
+def get_digit_surfs():
+    surfs = _digit_cache.get(palette_index)
+    if surfs is None:
+        surfs = [font.render(str(d), True, palette['fg']) for d in range(10)]
+        _digit_cache[palette_index] = surfs
+    return surfs
+
+_score_surf_cache = {}  # (palette_index, score) -> composed score Surface
+
+def get_score_surf(value):
+    # compose the score from the pre-rendered 0-9 glyphs on first sight of
+    # each (palette, value) pair; afterwards it is a plain dict hit
+    key = (palette_index, value)
+    score_surf = _score_surf_cache.get(key)
+    if score_surf is None:
+        digits = get_digit_surfs()
+        glyphs = [digits[int(ch)] for ch in str(value)]
+        width = sum(g.get_width() for g in glyphs)
+        height = max(g.get_height() for g in glyphs)
+        score_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for g in glyphs:
+            score_surf.blit(g, (x, 0))
+            x += g.get_width()
+        _score_surf_cache[key] = score_surf
+    return score_surf
+
+def render_score(surf, left_score, right_score):
+    surf_l = get_score_surf(left_score)
+    surf_r = get_score_surf(right_score)
+    return [surf.blit(surf_l, (WIDTH // 4 - surf_l.get_width() // 2, 24)),
+            surf.blit(surf_r, (3 * WIDTH // 4 - surf_r.get_width() // 2, 24))]
+
+def render_overlay_text(surf, text):
+    key = (palette_index, text)
+    txt = _overlay_cache.get(key)
+    if txt is None:
+        txt = _overlay_cache.setdefault(key, font.render(text, True, palette['accent']))
+    return surf.blit(txt, (HALF_WIDTH - txt.get_width() // 2, HEIGHT // 2 - txt.get_height() - 40))
+
+def render_hud(surf):
+    instr = _instr_cache.get(palette_index)
+    if instr is None:
+        instr = _instr_cache.setdefault(palette_index, instr_font.render(INSTRUCTION_TEXT, True, palette['fg']))
+    status_key = (palette_index, SOUND_ON)
+    status = _status_cache.get(status_key)
+    if status is None:
+        status_text = "Palette: %s | Sound: %s" % (palette['name'], "On" if SOUND_ON else "Off")
+        status = _status_cache.setdefault(status_key, status_font.render(status_text, True, palette['accent']))
+    return [surf.blit(instr, (HALF_WIDTH - instr.get_width() // 2, HEIGHT - 44)),
+            surf.blit(status, (HALF_WIDTH - status.get_width() // 2, HEIGHT - 24))]
+
+# Cached key constants: one get_pressed read and a subtraction per paddle
+# replaces the four-branch ladder, and up+down held together coalesces to a
+# no-op instead of two bounded moves.
+_K_W, _K_S, _K_UP, _K_DOWN = pygame.K_w, pygame.K_s, pygame.K_UP, pygame.K_DOWN
+
+def main():
+    global palette_index, palette, SOUND_ON
+    left = Paddle(30, HEIGHT // 2 - PADDLE_HEIGHT // 2)
+    right = Paddle(WIDTH - 30 - PADDLE_WIDTH, HEIGHT // 2 - PADDLE_HEIGHT // 2)
+    ball = Ball()
+    left_score = 0
+    right_score = 0
+    serving = True
+    winner = None
+    prev_dirty = [screen.get_rect()]  # first frame paints everything
+    redraw = True
+    accumulator = 0.0
+
+    while True:
+        dt = _tick(FPS) / 1000.0
+
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
+            redraw = True
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    pygame.quit()
+                    sys.exit()
+                if event.key == pygame.K_SPACE:
+                    if winner is not None:
+                        left_score = 0
+                        right_score = 0
+                        winner = None
+                        clear_text_caches()
+                    ball.reset()
+                    serving = False
+                if event.key == pygame.K_c:
+                    palette_index = (palette_index + 1) % len(PALETTES)
+                    palette = PALETTES[palette_index]
+                    clear_text_caches()
+                if event.key == pygame.K_m:
+                    SOUND_ON = not SOUND_ON
+
+        keys = pygame.key.get_pressed()
+        dy_left = (keys[_K_S] - keys[_K_W]) * PADDLE_SPEED
+        dy_right = (keys[_K_DOWN] - keys[_K_UP]) * PADDLE_SPEED
+        prev_left_y, prev_right_y = left.rect.y, right.rect.y
+        if particles or explosion_particles:
+            redraw = True
+
+        # Fixed-timestep simulation: paddles, ball and particles all advance
+        # in FIXED_DT steps, so a draw hiccup lands in the accumulator
+        # instead of stretching the integration. Capped so a long stall
+        # cannot trigger a catch-up spiral.
+        accumulator = min(accumulator + dt, 0.25)
+        while accumulator >= FIXED_DT:
+            accumulator -= FIXED_DT
+            left.move(dy_left, FIXED_DT)
+            right.move(dy_right, FIXED_DT)
+            if not serving and winner is None:
+                ball.update(left, right, FIXED_DT)
+                if ball.rect.right < 0:
+                    right_score += 1
+                    play_score_sound()
+                    ball.reset(direction=1)
+                    serving = True
+                elif ball.rect.left > WIDTH:
+                    left_score += 1
+                    play_score_sound()
+                    ball.reset(direction=-1)
+                    serving = True
+                if left_score >= WIN_SCORE or right_score >= WIN_SCORE:
+                    winner = "Left" if left_score >= WIN_SCORE else "Right"
+                    add_explosion(ball.rect.centerx, ball.rect.centery, palette['ball'])
+                    play_explosion_sound()
+            update_particles(FIXED_DT)
+
+        if left.rect.y != prev_left_y or right.rect.y != prev_right_y:
+            redraw = True
+        if not serving and winner is None:
+            redraw = True
+
+        # During the serve hold the scene is perfectly static; skip the whole
+        # draw/present block until something actually changes on screen.
+        if not redraw:
+            continue
+        redraw = False
+
+        # Erase last frame's moving pieces from the cached background, redraw
+        # them at their new positions, and update only those regions.
+        bg = get_background()
+        for r in prev_dirty:
+            screen.blit(bg, r, r)
+        dirty = draw_particles(screen)
+        blit_list = [left.blit_entry(), right.blit_entry()]
+        if winner is None:
+            blit_list.extend(ball.blit_entries(accumulator / FIXED_DT))
+        dirty.extend(screen.blits(blit_list))
+        dirty.extend(render_score(screen, left_score, right_score))
+        dirty.extend(render_hud(screen))
+        if winner is not None:
+            dirty.append(render_overlay_text(screen, "%s wins! Space to restart" % winner))
+        elif serving:
+            dirty.append(render_overlay_text(screen, "Press Space to serve"))
+        present(prev_dirty + dirty)
+        prev_dirty = dirty
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file